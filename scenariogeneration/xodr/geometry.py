@@ -11,15 +11,39 @@
 """
 
 import xml.etree.ElementTree as ET
+import math
 
 import numpy as np
 import pyclothoids as pcloth
+from scipy.integrate import quad
 from .exceptions import (
     NotEnoughInputArguments,
     ToManyOptionalArguments,
     MixOfGeometryAddition,
 )
-from scipy.integrate import quad
+
+# fixed Gauss-Legendre rules on [0,1], used for polynomial arc-length
+# integration; the lower order rule provides an error estimate
+_GL_NODES, _GL_WEIGHTS = np.polynomial.legendre.leggauss(50)
+_GL_NODES = 0.5 * (_GL_NODES + 1)
+_GL_WEIGHTS = 0.5 * _GL_WEIGHTS
+_GL_NODES_LOW, _GL_WEIGHTS_LOW = np.polynomial.legendre.leggauss(25)
+_GL_NODES_LOW = 0.5 * (_GL_NODES_LOW + 1)
+_GL_WEIGHTS_LOW = 0.5 * _GL_WEIGHTS_LOW
+
+
+def _f(value):
+    """formats a number with the shortest round-trip representation"""
+    return str(value)
+
+
+def _cos_sin(h):
+    """returns (cos(h), sin(h)), skipping the trig calls for axis aligned headings"""
+    rem = h % (math.pi / 2)
+    if rem < 1e-12 or math.pi / 2 - rem < 1e-12:
+        quadrant = round(h / (math.pi / 2)) % 4
+        return ((1.0, 0.0), (0.0, 1.0), (-1.0, 0.0), (0.0, -1.0))[quadrant]
+    return math.cos(h), math.sin(h)
 
 
 class PlanView:
@@ -94,6 +118,7 @@ class PlanView:
         self._raw_geometries = []
         self._adjusted_geometries = []
         self._overridden_headings = []
+        self._geometry_soa = None
 
         self.adjusted = False
         # variable to track what mode of adding geometries are used
@@ -245,7 +270,18 @@ class PlanView:
             self.y_start = self.present_y
             self.h_start = self.present_h
 
-            for i in range(len(self._raw_geometries)):
+            i = 0
+            while i < len(self._raw_geometries):
+                j = i
+                while j < len(self._raw_geometries) and isinstance(
+                    self._raw_geometries[j], Line
+                ):
+                    j += 1
+                if j > i:
+                    # contiguous run of Lines, adjust in one vectorized pass
+                    self._adjust_line_run(i, j)
+                    i = j
+                    continue
                 if len(self._overridden_headings) > 0:
                     self.present_h = self._overridden_headings[i]
 
@@ -265,6 +301,7 @@ class PlanView:
                 self.present_s += length
 
                 self._adjusted_geometries.append(newgeom)
+                i += 1
             self.x_end = self.present_x
             self.y_end = self.present_y
             self.h_end = self.present_h
@@ -272,7 +309,7 @@ class PlanView:
         else:
             self.x_end = self.present_x
             self.y_end = self.present_y
-            self.h_end = self.present_h + np.pi
+            self.h_end = self.present_h + math.pi
 
             lengths = []
             for i in range(len(self._raw_geometries) - 1, -1, -1):
@@ -294,7 +331,7 @@ class PlanView:
 
             self.x_start = self.present_x
             self.y_start = self.present_y
-            self.h_start = self.present_h + np.pi
+            self.h_start = self.present_h + math.pi
 
             length = sum(lengths)
             self.present_s = 0
@@ -303,19 +340,121 @@ class PlanView:
                 self._adjusted_geometries[i].set_s(self.present_s)
                 self.present_s += lengths[i]
             self._adjusted_geometries.reverse()
+        self._build_geometry_soa()
         self.adjusted = True
 
+    def _adjust_line_run(self, start, stop):
+        """adjusts a contiguous run of Line geometries with a vectorized prefix sum
+
+        Parameters
+        ----------
+            start (int): index of the first Line in _raw_geometries
+
+            stop (int): index one past the last Line in _raw_geometries
+
+        """
+        lines = self._raw_geometries[start:stop]
+        lengths = np.array([line.length for line in lines])
+        if len(self._overridden_headings) > 0:
+            headings = np.array(self._overridden_headings[start:stop], dtype=float)
+        else:
+            headings = np.full(len(lines), self.present_h, dtype=float)
+        xs = self.present_x + np.cumsum(lengths * np.cos(headings))
+        ys = self.present_y + np.cumsum(lengths * np.sin(headings))
+        ss = self.present_s + np.cumsum(lengths)
+
+        for i, line in enumerate(lines):
+            self._adjusted_geometries.append(
+                _Geometry(
+                    self.present_s,
+                    self.present_x,
+                    self.present_y,
+                    headings[i],
+                    line,
+                    end_data=(xs[i], ys[i], headings[i], line.length),
+                )
+            )
+            self.present_x = xs[i]
+            self.present_y = ys[i]
+            self.present_s = ss[i]
+        self.present_h = headings[-1]
+
+    def _build_geometry_soa(self):
+        """stores the adjusted geometry data as parallel arrays (structure of
+        arrays), used to serialize the planview without going through the
+        _Geometry objects
+        """
+        self._geometry_soa = (
+            np.array([geom.s for geom in self._adjusted_geometries]),
+            np.array([geom.x for geom in self._adjusted_geometries]),
+            np.array([geom.y for geom in self._adjusted_geometries]),
+            np.array([geom.heading for geom in self._adjusted_geometries]),
+            np.array([geom.length for geom in self._adjusted_geometries]),
+        )
+
     def get_total_length(self):
         """returns the total length of the planView"""
 
         return self.present_s
 
+    def write_fragment(self, buffer):
+        """writes the planView XML fragment directly to a buffer, without
+        building the intermediate ElementTree
+
+        Parameters
+        ----------
+            buffer (file like object): text buffer to write the fragment to
+
+        """
+        geometry_format = '<geometry s="{}" x="{}" y="{}" hdg="{}" length="{}">'
+        buffer.write("<planView>")
+        if self._geometry_soa is not None:
+            ss, xs, ys, hs, lengths = self._geometry_soa
+            for i in range(len(ss)):
+                buffer.write(
+                    geometry_format.format(
+                        _f(ss[i]), _f(xs[i]), _f(ys[i]), _f(hs[i]), _f(lengths[i])
+                    )
+                )
+                self._raw_geometries[i].write_fragment(buffer)
+                buffer.write("</geometry>")
+        else:
+            for geom in self._adjusted_geometries:
+                buffer.write(
+                    geometry_format.format(
+                        _f(geom.s),
+                        _f(geom.x),
+                        _f(geom.y),
+                        _f(geom.heading),
+                        _f(geom.length),
+                    )
+                )
+                geom.geom_type.write_fragment(buffer)
+                buffer.write("</geometry>")
+        buffer.write("</planView>")
+
     def get_element(self):
         """returns the elementTree of the WorldPostion"""
 
         element = ET.Element("planView")
-        for geom in self._adjusted_geometries:
-            element.append(geom.get_element())
+        if self._geometry_soa is not None:
+            ss, xs, ys, hs, lengths = self._geometry_soa
+            for i in range(len(ss)):
+                geom_element = ET.SubElement(
+                    element,
+                    "geometry",
+                    {
+                        "s": _f(ss[i]),
+                        "x": _f(xs[i]),
+                        "y": _f(ys[i]),
+                        "hdg": _f(hs[i]),
+                        "length": _f(lengths[i]),
+                    },
+                )
+                self._raw_geometries[i].append_to(geom_element)
+        else:
+            for geom in self._adjusted_geometries:
+                element.append(geom.get_element())
         return element
 
 
@@ -355,7 +494,7 @@ class _Geometry:
             Returns a dictionary of all attributes of the class
     """
 
-    def __init__(self, s, x, y, heading, geom_type):
+    def __init__(self, s, x, y, heading, geom_type, end_data=None):
         """initalizes the PlanView
 
         Parameters
@@ -370,6 +509,9 @@ class _Geometry:
 
             geom_type (Line, Spiral,ParamPoly3, or Arc): the type of geometry
 
+            end_data (tuple of (x, y, h, length)): precomputed end point of the
+                geometry, to skip recalculating it (optional)
+
         """
         self.s = s
         self.x = x
@@ -377,7 +519,20 @@ class _Geometry:
 
         self.heading = heading
         self.geom_type = geom_type
-        _, _, _, self.length = self.geom_type.get_end_data(self.x, self.y, self.heading)
+        if end_data is None:
+            if type(geom_type) is Line:
+                cos_h, sin_h = _cos_sin(self.heading)
+                end_data = (
+                    self.x + geom_type.length * cos_h,
+                    self.y + geom_type.length * sin_h,
+                    self.heading,
+                    geom_type.length,
+                )
+            else:
+                end_fn = _END_DATA_FN.get(type(geom_type), type(geom_type).get_end_data)
+                end_data = end_fn(geom_type, self.x, self.y, self.heading)
+        self._end = end_data
+        self.length = end_data[3]
 
     def __eq__(self, other):
         if isinstance(other, _Geometry):
@@ -389,7 +544,9 @@ class _Geometry:
         return False
 
     def get_end_data(self):
-        return self.geom_type.get_end_data(self.x, self.y, self.heading)
+        if self._end is None:
+            self._end = self.geom_type.get_end_data(self.x, self.y, self.heading)
+        return self._end
 
     def get_start_data(self):
         x, y, heading, self.length = self.geom_type.get_start_data(
@@ -397,8 +554,9 @@ class _Geometry:
         )
         self.x = x
         self.y = y
-        self.heading = heading + np.pi
+        self.heading = heading + math.pi
         self.s = None
+        self._end = None
         return x, y, heading, self.length
 
     def set_s(self, s):
@@ -406,18 +564,18 @@ class _Geometry:
 
     def get_attributes(self):
         """returns the attributes of the _Geometry as a dict"""
-        retdict = {}
-        retdict["s"] = str(self.s)
-        retdict["x"] = str(self.x)
-        retdict["y"] = str(self.y)
-        retdict["hdg"] = str(self.heading)
-        retdict["length"] = str(self.length)
-        return retdict
+        return {
+            "s": _f(self.s),
+            "x": _f(self.x),
+            "y": _f(self.y),
+            "hdg": _f(self.heading),
+            "length": _f(self.length),
+        }
 
     def get_element(self):
         """returns the elementTree of the _Geometry"""
         element = ET.Element("geometry", attrib=self.get_attributes())
-        element.append(self.geom_type.get_element())
+        self.geom_type.append_to(element)
         return element
 
 
@@ -471,8 +629,8 @@ class Line:
 
         """
 
-        new_x = self.length * np.cos(h) + x
-        new_y = self.length * np.sin(h) + y
+        new_x = self.length * math.cos(h) + x
+        new_y = self.length * math.sin(h) + y
         new_h = h
 
         return new_x, new_y, new_h, self.length
@@ -499,8 +657,8 @@ class Line:
             length (float): length of the road
 
         """
-        start_x = self.length * np.cos(end_h) + end_x
-        start_y = self.length * np.sin(end_h) + end_y
+        start_x = self.length * math.cos(end_h) + end_x
+        start_y = self.length * math.sin(end_h) + end_y
         start_h = end_h
 
         return start_x, start_y, start_h, self.length
@@ -511,6 +669,14 @@ class Line:
 
         return element
 
+    def append_to(self, parent):
+        """appends the line element to a parent element"""
+        return ET.SubElement(parent, "line")
+
+    def write_fragment(self, buffer):
+        """writes the line XML fragment directly to a buffer"""
+        buffer.write("<line/>")
+
 
 class Arc:
     """the Arc creates a arc type of geometry
@@ -571,6 +737,7 @@ class Arc:
                 "You are creating a straight line, please use Line instead"
             )
         self.curvature = curvature
+        self._inv_curvature = 1.0 / curvature
 
         if self.length:
             self.angle = self.length * self.curvature
@@ -607,28 +774,20 @@ class Arc:
             length (float): length of the element
 
         """
-        radius = 1 / np.abs(self.curvature)
-        if self.curvature < 0:
-            phi_0 = h + np.pi / 2
-            x_0 = x - np.cos(phi_0) * radius
-            y_0 = y - np.sin(phi_0) * radius
-
-        else:
-            phi_0 = h - np.pi / 2
-            x_0 = x - np.cos(phi_0) * radius
-            y_0 = y - np.sin(phi_0) * radius
-
         if self.length:
             self.angle = self.length * self.curvature
-
-        new_ang = self.angle + phi_0
         if self.angle:
-            self.length = np.abs(radius * self.angle)
-
-        new_ang = self.angle + phi_0
+            self.length = abs(self.angle * self._inv_curvature)
+
+        # chord form, valid for both curvature signs
+        inv_k = self._inv_curvature
+        du = math.sin(self.angle) * inv_k
+        dv = (1 - math.cos(self.angle)) * inv_k
+        cos_h = math.cos(h)
+        sin_h = math.sin(h)
+        new_x = x + du * cos_h - dv * sin_h
+        new_y = y + du * sin_h + dv * cos_h
         new_h = h + self.angle
-        new_x = np.cos(new_ang) * radius + x_0
-        new_y = np.sin(new_ang) * radius + y_0
 
         return new_x, new_y, new_h, self.length
 
@@ -659,32 +818,32 @@ class Arc:
         y = end_y
         h = end_h
         inv_curv = -self.curvature
-        radius = 1 / np.abs(inv_curv)
+        radius = abs(self._inv_curvature)
         if inv_curv < 0:
-            phi_0 = h + np.pi / 2
-            x_0 = x - np.cos(phi_0) * radius
-            y_0 = y - np.sin(phi_0) * radius
+            phi_0 = h + math.pi / 2
+            x_0 = x - math.cos(phi_0) * radius
+            y_0 = y - math.sin(phi_0) * radius
 
         else:
-            phi_0 = h - np.pi / 2
-            x_0 = x - np.cos(phi_0) * radius
-            y_0 = y - np.sin(phi_0) * radius
+            phi_0 = h - math.pi / 2
+            x_0 = x - math.cos(phi_0) * radius
+            y_0 = y - math.sin(phi_0) * radius
 
         if self.length:
             self.angle = self.length * inv_curv
 
         new_ang = self.angle + phi_0
         if self.angle:
-            self.length = np.abs(radius * self.angle)
+            self.length = abs(radius * self.angle)
 
         new_h = h + self.angle
-        new_x = np.cos(new_ang) * radius + x_0
-        new_y = np.sin(new_ang) * radius + y_0
+        new_x = math.cos(new_ang) * radius + x_0
+        new_y = math.sin(new_ang) * radius + y_0
         return new_x, new_y, new_h, self.length
 
     def get_attributes(self):
         """returns the attributes of the Arc as a dict"""
-        return {"curvature": str(self.curvature)}
+        return {"curvature": _f(self.curvature)}
 
     def get_element(self):
         """returns the elementTree of the Arc"""
@@ -692,6 +851,14 @@ class Arc:
 
         return element
 
+    def append_to(self, parent):
+        """appends the arc element to a parent element"""
+        return ET.SubElement(parent, "arc", attrib=self.get_attributes())
+
+    def write_fragment(self, buffer):
+        """writes the arc XML fragment directly to a buffer"""
+        buffer.write('<arc curvature="{}"/>'.format(_f(self.curvature)))
+
 
 class ParamPoly3:
     """the ParamPoly3 class creates a parampoly3 type of geometry, in the coordinate systeme U (along road), V (normal to the road)
@@ -795,6 +962,19 @@ class ParamPoly3:
         self.cv = cv
         self.dv = dv
         self.prange = prange
+        self._u_coeffs = np.array([du, cu, bu, au], dtype=np.float64)
+        self._v_coeffs = np.array([dv, cv, bv, av], dtype=np.float64)
+        self._du_coeffs = np.array([3 * du, 2 * cu, bu], dtype=np.float64)
+        self._dv_coeffs = np.array([3 * dv, 2 * cv, bv], dtype=np.float64)
+        self._length_coeffs = np.array(
+            [
+                9 * (du**2 + dv**2),
+                12 * (cu * du + cv * dv),
+                2 * (3 * bu * du + 2 * cu**2 + 3 * bv * dv + 2 * cv**2),
+                4 * (bu * cu + bv * cv),
+                bu**2 + bv**2,
+            ]
+        )
         if prange == "arcLength" and length == None:
             raise ValueError("No length was provided for Arc with arcLength option")
         if length:
@@ -808,14 +988,29 @@ class ParamPoly3:
                 return True
         return False
 
-    def _integrand(self, p):
-        """integral function to calulate length of polynomial,
-        #TODO: This is not tested or verified...
+    def _calc_length(self):
+        """calculates the arc length of the polynomial over p in [0,1]
+
+        uses a fixed 50 point Gauss-Legendre quadrature, cross checked
+        against a 25 point rule, and falls back to adaptive quadrature
+        when the two estimates disagree by more than 1e-9 relative
+        (which happens near cusps, where the square root integrand is
+        not smooth)
+
+        the squared derivative polynomial is clamped at zero, since the
+        expanded form can evaluate slightly negative near a cusp
         """
-        return np.sqrt(
-            (abs(3 * self.du * p**2 + 2 * self.cu * p + self.bu)) ** 2
-            + (abs(3 * self.dv * p**2 + 2 * self.cv * p + self.bv)) ** 2
-        )
+        values = np.maximum(np.polyval(self._length_coeffs, _GL_NODES), 0.0)
+        length = float(_GL_WEIGHTS @ np.sqrt(values))
+        values_low = np.maximum(np.polyval(self._length_coeffs, _GL_NODES_LOW), 0.0)
+        length_low = float(_GL_WEIGHTS_LOW @ np.sqrt(values_low))
+        if abs(length - length_low) > 1e-9 * length:
+            return quad(
+                lambda p: math.sqrt(max(np.polyval(self._length_coeffs, p), 0.0)),
+                0,
+                1,
+            )[0]
+        return length
 
     def get_start_data(self, x, y, h):
         """Returns the start point of the geometry
@@ -838,18 +1033,16 @@ class ParamPoly3:
         """
         if self.prange == "normalized":
             p = 1
-            I = quad(self._integrand, 0, 1)
-            self.length = I[0]
+            self.length = self._calc_length()
         else:
             p = self.length
-        newu = self.au + self.bu * p + self.cu * p**2 + self.du * p**3
-        newv = self.av + self.bv * p + self.cv * p**2 + self.dv * p**3
-
-        new_x = x - (newu * np.cos(h) - np.sin(h) * newv)
-        new_y = y - (newu * np.sin(h) + np.cos(h) * newv)
-        new_h = h - np.arctan2(
-            self.bv + 2 * self.cv * p + 3 * self.dv * p**2,
-            self.bu + 2 * self.cu * p + 3 * self.du * p**2,
+        newu = np.polyval(self._u_coeffs, p)
+        newv = np.polyval(self._v_coeffs, p)
+
+        new_x = x - (newu * math.cos(h) - math.sin(h) * newv)
+        new_y = y - (newu * math.sin(h) + math.cos(h) * newv)
+        new_h = h - math.atan2(
+            np.polyval(self._dv_coeffs, p), np.polyval(self._du_coeffs, p)
         )
 
         return new_x, new_y, new_h, self.length
@@ -875,35 +1068,33 @@ class ParamPoly3:
         """
         if self.prange == "normalized":
             p = 1
-            I = quad(self._integrand, 0, 1)
-            self.length = I[0]
+            self.length = self._calc_length()
         else:
             p = self.length
-        newu = self.au + self.bu * p + self.cu * p**2 + self.du * p**3
-        newv = self.av + self.bv * p + self.cv * p**2 + self.dv * p**3
-
-        new_x = x + newu * np.cos(h) - np.sin(h) * newv
-        new_y = y + newu * np.sin(h) + np.cos(h) * newv
-        new_h = h + np.arctan2(
-            self.bv + 2 * self.cv * p + 3 * self.dv * p**2,
-            self.bu + 2 * self.cu * p + 3 * self.du * p**2,
+        newu = np.polyval(self._u_coeffs, p)
+        newv = np.polyval(self._v_coeffs, p)
+
+        new_x = x + newu * math.cos(h) - math.sin(h) * newv
+        new_y = y + newu * math.sin(h) + math.cos(h) * newv
+        new_h = h + math.atan2(
+            np.polyval(self._dv_coeffs, p), np.polyval(self._du_coeffs, p)
         )
 
         return new_x, new_y, new_h, self.length
 
     def get_attributes(self):
         """returns the attributes of the ParamPoly3 as a dict"""
-        retdict = {}
-        retdict["aU"] = str(self.au)
-        retdict["bU"] = str(self.bu)
-        retdict["cU"] = str(self.cu)
-        retdict["dU"] = str(self.du)
-        retdict["aV"] = str(self.av)
-        retdict["bV"] = str(self.bv)
-        retdict["cV"] = str(self.cv)
-        retdict["dV"] = str(self.dv)
-        retdict["pRange"] = self.prange
-        return retdict
+        return {
+            "aU": _f(self.au),
+            "bU": _f(self.bu),
+            "cU": _f(self.cu),
+            "dU": _f(self.du),
+            "aV": _f(self.av),
+            "bV": _f(self.bv),
+            "cV": _f(self.cv),
+            "dV": _f(self.dv),
+            "pRange": self.prange,
+        }
 
     def get_element(self):
         """returns the elementTree of the ParamPoly3"""
@@ -911,6 +1102,27 @@ class ParamPoly3:
 
         return element
 
+    def append_to(self, parent):
+        """appends the paramPoly3 element to a parent element"""
+        return ET.SubElement(parent, "paramPoly3", attrib=self.get_attributes())
+
+    def write_fragment(self, buffer):
+        """writes the paramPoly3 XML fragment directly to a buffer"""
+        buffer.write(
+            '<paramPoly3 aU="{}" bU="{}" cU="{}" dU="{}" '
+            'aV="{}" bV="{}" cV="{}" dV="{}" pRange="{}"/>'.format(
+                _f(self.au),
+                _f(self.bu),
+                _f(self.cu),
+                _f(self.du),
+                _f(self.av),
+                _f(self.bv),
+                _f(self.cv),
+                _f(self.dv),
+                self.prange,
+            )
+        )
+
 
 class Spiral:
     """the Spiral (Clothoid) creates a spiral type of geometry
@@ -969,12 +1181,13 @@ class Spiral:
                 "Spiral is overdefined, please use only one of the optional inputs"
             )
         if angle:
-            self.length = 2 * abs(angle) / np.maximum(abs(curvend), abs(curvstart))
+            self.length = 2 * abs(angle) / max(abs(curvend), abs(curvstart))
 
         elif cdot:
             self.length = (self.curvend - self.curvstart) / cdot
         else:
             self.length = length
+        self._cdot = (self.curvend - self.curvstart) / self.length
 
     def __eq__(self, other):
         if isinstance(other, Spiral):
@@ -1007,7 +1220,7 @@ class Spiral:
             y,
             h,
             self.curvstart,
-            (self.curvend - self.curvstart) / self.length,
+            self._cdot,
             self.length,
         )
 
@@ -1038,7 +1251,7 @@ class Spiral:
             end_y,
             end_h,
             -self.curvend,
-            -(self.curvstart - self.curvend) / self.length,
+            self._cdot,
             self.length,
         )
 
@@ -1046,10 +1259,32 @@ class Spiral:
 
     def get_attributes(self):
         """returns the attributes of the Line as a dict"""
-        return {"curvStart": str(self.curvstart), "curvEnd": str(self.curvend)}
+        return {"curvStart": _f(self.curvstart), "curvEnd": _f(self.curvend)}
 
     def get_element(self):
         """returns the elementTree of the Line"""
         element = ET.Element("spiral", attrib=self.get_attributes())
 
         return element
+
+    def append_to(self, parent):
+        """appends the spiral element to a parent element"""
+        return ET.SubElement(parent, "spiral", attrib=self.get_attributes())
+
+    def write_fragment(self, buffer):
+        """writes the spiral XML fragment directly to a buffer"""
+        buffer.write(
+            '<spiral curvStart="{}" curvEnd="{}"/>'.format(
+                _f(self.curvstart), _f(self.curvend)
+            )
+        )
+
+
+# type-indexed dispatch table, skips per-call attribute resolution on the
+# known geometry types
+_END_DATA_FN = {
+    Line: Line.get_end_data,
+    Arc: Arc.get_end_data,
+    Spiral: Spiral.get_end_data,
+    ParamPoly3: ParamPoly3.get_end_data,
+}
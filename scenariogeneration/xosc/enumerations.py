@@ -12,7 +12,10 @@
 XMLNS = "http://www.w3.org/2001/XMLSchema-instance"
 XSI = "OpenScenario.xsd"
 
+import copy
 import re
+import xml.etree.ElementTree as ET
+from functools import wraps
 from .exceptions import OpenSCENARIOVersionError
 from os import error
 import warnings
@@ -39,6 +42,63 @@ class VersionBase:
         VersionBase.version_major = major
         VersionBase.version_minor = minor
 
+    def __hash__(self):
+        """hash of the serialized element, memoized since the serialization is
+        costly; any public attribute assignment (via __setattr__) or mutating
+        method resets it, and a change of the OpenSCENARIO version triggers a
+        recompute (the serialization, and hence the hash, is version
+        dependent)
+
+        Note: subclasses that define __eq__ have to opt in with
+        __hash__ = VersionBase.__hash__
+        """
+        version = (VersionBase.version_major, VersionBase.version_minor)
+        cached = getattr(self, "_hash", None)
+        if cached is None or cached[0] != version:
+            cached = (version, hash(ET.tostring(self.get_element())))
+            self._hash = cached
+        return cached[1]
+
+    def __setattr__(self, name, value):
+        """resets the memoized hash and element caches when a public attribute
+        is reassigned, since the serialization depends on them
+        """
+        if name[0] != "_":
+            self.__dict__["_hash"] = None
+            self.__dict__["_element_cache"] = None
+        object.__setattr__(self, name, value)
+
+    def _invalidate_caches(self):
+        self._hash = None
+        self._element_cache = None
+
+
+def cached_element(get_element):
+    """decorator that caches the result of a no-argument get_element call on
+    the instance, until a public attribute is reassigned, a mutating method
+    calls _invalidate_caches or the OpenSCENARIO version is changed; calls
+    with arguments bypass the cache
+
+    a copy of the cached element is returned, so callers are free to mutate
+    it as with an uncached get_element
+
+    Note: only apply to classes whose children cannot mutate after being
+    added, a child mutator cannot invalidate the caches of its parents
+    """
+
+    @wraps(get_element)
+    def wrapper(self, *args, **kwargs):
+        if args or kwargs:
+            return get_element(self, *args, **kwargs)
+        version = (VersionBase.version_major, VersionBase.version_minor)
+        cached = getattr(self, "_element_cache", None)
+        if cached is None or cached[0] != version:
+            cached = (version, get_element(self))
+            self._element_cache = cached
+        return copy.deepcopy(cached[1])
+
+    return wrapper
+
 
 class _OscEnum(VersionBase):
     """custom "enum" class to be able to handle different versions of the enums in OpenSCENARIO
@@ -108,6 +168,9 @@ class _OscEnum(VersionBase):
                 return True
         return False
 
+    def __hash__(self):
+        return hash((self.classname, self.name))
+
     def get_name(self):
         """method that should be used when using the _OscEnum to get the string, will check version of the enum to see if it is used correctly with the used version
 
@@ -42,6 +42,7 @@ from .enumerations import (
     Role,
     FollowingMode,
     _OscEnum,
+    cached_element,
 )
 import datetime as dt
 
@@ -148,11 +149,15 @@ class ParameterDeclarations(VersionBase):
         return parameter_declarations
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, ParameterDeclarations):
             if self.parameters == other.parameters:
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     def add_parameter(self, parameter):
         """add_parameter adds a Parameter to the ParameterDeclarations
 
@@ -162,6 +167,7 @@ class ParameterDeclarations(VersionBase):
 
 
         """
+        self._invalidate_caches()
         if not isinstance(parameter, Parameter):
             raise TypeError("parameter input is not of type Parameter")
         self.parameters.append(parameter)
@@ -220,11 +226,15 @@ class VariableDeclarations(VersionBase):
         return variable_declarations
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, VariableDeclarations):
             if self.variables == other.variables:
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     def add_variable(self, variable):
         """add_variable adds a Variable to the VariableDeclarations
 
@@ -234,6 +244,7 @@ class VariableDeclarations(VersionBase):
 
 
         """
+        self._invalidate_caches()
         if not isinstance(variable, Variable):
             raise TypeError("variable input is not of type Variable")
         self.variables.append(variable)
@@ -305,10 +316,13 @@ class EntityRef(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     def get_attributes(self):
         """returns the attributes of the EntityRef as a dict"""
         return {"entityRef": self.entity}
 
+    @cached_element
     def get_element(self):
         """returns the elementTree of the EntityRef"""
         return ET.Element("EntityRef", attrib=self.get_attributes())
@@ -381,6 +395,8 @@ class Parameter(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Parameter
@@ -415,6 +431,7 @@ class Parameter(VersionBase):
             constraint_group (ValueConstraintGroup): the value constraint group to be added
 
         """
+        self._invalidate_caches()
         if not isinstance(constraint_group, ValueConstraintGroup):
             raise TypeError(
                 "value_conatraint input is not of type ValueConstraintGroup"
@@ -431,7 +448,10 @@ class Parameter(VersionBase):
         }
 
     def get_element(self):
-        """returns the elementTree of the Parameter"""
+        """returns the elementTree of the Parameter
+
+        Note: not cached, the constraint groups can mutate after being added
+        """
         element = ET.Element("ParameterDeclaration", attrib=self.get_attributes())
         if self.constraint_groups:
             for constraint_group in self.constraint_groups:
@@ -497,6 +517,8 @@ class Variable(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Variable
@@ -602,6 +624,8 @@ class Orientation(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Orientation
@@ -664,6 +688,7 @@ class Orientation(VersionBase):
 
         return retdict
 
+    @cached_element
     def get_element(self):
         """returns the elementTree of the Orientation"""
         return ET.Element("Orientation", attrib=self.get_attributes())
@@ -731,6 +756,8 @@ class TransitionDynamics(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of TransitionDynamics
@@ -765,6 +792,7 @@ class TransitionDynamics(VersionBase):
             retdict["followingMode"] = self.following_mode.get_name()
         return retdict
 
+    @cached_element
     def get_element(self, name="TransitionDynamics"):
         """returns the elementTree of the TransitionDynamics"""
         return ET.Element(name, self.get_attributes())
@@ -873,6 +901,8 @@ class DynamicsConstraints(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     def is_filled(self):
         """is_filled check is any constraints are set
 
@@ -971,6 +1001,8 @@ class License(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     # TODO: Check Class License test string 0..1 The full license
 
     @staticmethod
@@ -1115,6 +1147,8 @@ class FileHeader(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     # TODO: License handling add_license ???
 
     @staticmethod
@@ -1244,6 +1278,8 @@ class TimeReference(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of TimeReference
@@ -1344,6 +1380,8 @@ class _TrafficSignalState(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of _TrafficSignalState
@@ -1430,6 +1468,8 @@ class Phase(VersionBase):
         self.traffic_group_state = traffic_group_state
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, Phase):
             if (
                 self.get_attributes() == other.get_attributes()
@@ -1438,6 +1478,8 @@ class Phase(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Phase
@@ -1475,6 +1517,7 @@ class Phase(VersionBase):
             state (str): state of the signal defined in the road network
 
         """
+        self._invalidate_caches()
         self.signalstates.append(_TrafficSignalState(signal_id, state))
         return self
 
@@ -1485,6 +1528,7 @@ class Phase(VersionBase):
         retdict["duration"] = str(self.duration)
         return retdict
 
+    @cached_element
     def get_element(self):
         """returns the elementTree of the Polyline"""
         element = ET.Element("Phase", attrib=self.get_attributes())
@@ -1562,6 +1606,8 @@ class TrafficSignalController(VersionBase):
         self.phases = []
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, TrafficSignalController):
             if (
                 self.get_attributes() == other.get_attributes()
@@ -1570,6 +1616,8 @@ class TrafficSignalController(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of TrafficSignalController
@@ -1610,6 +1658,7 @@ class TrafficSignalController(VersionBase):
             phase (Phase): a phase of the trafficsignal
 
         """
+        self._invalidate_caches()
         if not isinstance(phase, Phase):
             raise TypeError("phase input is not of type Phase")
         self.phases.append(phase)
@@ -1691,6 +1740,8 @@ class TrafficDefinition(VersionBase):
         self.vehicle_roles_weights = []
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, TrafficDefinition):
             if (
                 self.get_attributes() == other.get_attributes()
@@ -1704,6 +1755,8 @@ class TrafficDefinition(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of TrafficDefinition
@@ -1764,6 +1817,7 @@ class TrafficDefinition(VersionBase):
             weight (float): the corresponding weight for the distribution of the vehicle category
 
         """
+        self._invalidate_caches()
         self.vehiclecategories.append(convert_enum(vehiclecategory, VehicleCategory))
         self.vehicleweights.append(weight)
         return self
@@ -1777,6 +1831,7 @@ class TrafficDefinition(VersionBase):
 
             weight (float): the weight of that vehicle role
         """
+        self._invalidate_caches()
         self.vehicle_roles_weights.append(convert_float(weight))
         self.vehicle_roles.append(convert_enum(vehicle_role, Role))
 
@@ -1790,6 +1845,7 @@ class TrafficDefinition(VersionBase):
             weight (float): the corresponding weight for the controller
 
         """
+        self._invalidate_caches()
         if not (
             isinstance(controller, Controller)
             or isinstance(controller, CatalogReference)
@@ -1901,6 +1957,7 @@ class CatalogFile(VersionBase):
             osc_minor_version (int): the minor version of OpenSCENARIO to write to the catalog
                 Default: 1
         """
+        self._invalidate_caches()
         if self.catalog_element == None:
             OSError("No file has been created or opened")
         fileheader = self.catalog_element.find("FileHeader")
@@ -2014,11 +2071,15 @@ class Catalog(VersionBase):
         self.catalogs = {}
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, Catalog):
             if self.catalogs == other.catalogs:
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Catalog
@@ -2086,6 +2147,7 @@ class Catalog(VersionBase):
             path (str): path to the catalog
 
         """
+        self._invalidate_caches()
 
         if catalogname not in self._CATALOGS:
             raise ValueError(
@@ -2162,6 +2224,8 @@ class CatalogReference(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     # TODO: CatalogElement???
 
     @staticmethod
@@ -2199,6 +2263,7 @@ class CatalogReference(VersionBase):
 
             value (str): assigned value of the parameter
         """
+        self._invalidate_caches()
         self.parameterassignments.append(ParameterAssignment(parameterref, value))
         return self
 
@@ -2259,11 +2324,15 @@ class ParameterAssignment(VersionBase):
         self.value = value
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, ParameterAssignment):
             if self.get_attributes() == other.get_attributes():
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of ParameterAssignment
@@ -2290,6 +2359,7 @@ class ParameterAssignment(VersionBase):
         retdict["value"] = str(self.value)
         return retdict
 
+    @cached_element
     def get_element(self):
         """returns the elementTree of the ParameterAssignment"""
         return ET.Element("ParameterAssignment", attrib=self.get_attributes())
@@ -2377,6 +2447,8 @@ class TimeOfDay(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of TimeOfDay
@@ -2568,6 +2640,8 @@ class Weather(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Weather
@@ -2759,6 +2833,8 @@ class Fog(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Fog
@@ -2851,6 +2927,8 @@ class Sun(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Sun
@@ -2938,6 +3016,8 @@ class Precipitation(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Precipitation
@@ -3026,6 +3106,8 @@ class Wind(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Wind
@@ -3119,6 +3201,8 @@ class RoadCondition(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of RoadCondition
@@ -3235,6 +3319,8 @@ class Environment(VersionBase):
         self.parameters = parameters
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, Environment):
             if (
                 self.get_attributes() == other.get_attributes()
@@ -3246,6 +3332,8 @@ class Environment(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Environment
@@ -3388,6 +3476,8 @@ class Controller(VersionBase):
         self.controller_type = convert_enum(controller_type, ControllerType, True)
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, Controller):
             if (
                 self.properties == other.properties
@@ -3398,6 +3488,8 @@ class Controller(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Controller
@@ -3467,6 +3559,7 @@ class Controller(VersionBase):
             parameter (Parameter): A new parameter declaration for the Controller
 
         """
+        self._invalidate_caches()
         if not isinstance(parameter, Parameter):
             raise TypeError("parameter input is not of type Parameter")
         self.parameters.add_parameter(parameter)
@@ -3556,6 +3649,9 @@ class BoundingBox(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
+    @cached_element
     def get_element(self):
         """returns the elementTree of the Dimensions"""
         element = ET.Element("BoundingBox")
@@ -3663,10 +3759,13 @@ class Center(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     def get_attributes(self):
         """returns the attributes as a dict of the Center"""
         return {"x": str(self.x), "y": str(self.y), "z": str(self.z)}
 
+    @cached_element
     def get_element(self):
         """returns the elementTree of the Center"""
         element = ET.Element("Center", attrib=self.get_attributes())
@@ -3746,6 +3845,8 @@ class Dimensions(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     def get_attributes(self):
         """returns the attributes as a dict of the Dimensions"""
         return {
@@ -3754,6 +3855,7 @@ class Dimensions(VersionBase):
             "height": str(self.height),
         }
 
+    @cached_element
     def get_element(self):
         """returns the elementTree of the Dimensions"""
         element = ET.Element("Dimensions", attrib=self.get_attributes())
@@ -3792,11 +3894,15 @@ class Properties(VersionBase):
         self.properties = []
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, Properties):
             if self.files == other.files and self.properties == other.properties:
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of class Properties:
@@ -3834,6 +3940,7 @@ class Properties(VersionBase):
             filename (str): name of the file
 
         """
+        self._invalidate_caches()
 
         self.files.append(filename)
         return self
@@ -3848,9 +3955,11 @@ class Properties(VersionBase):
             value (str): value of the property
 
         """
+        self._invalidate_caches()
         self.properties.append((name, value))
         return self
 
+    @cached_element
     def get_element(self):
         """returns the elementTree of the Properties"""
         element = ET.Element("Properties")
@@ -3916,6 +4025,8 @@ class AbsoluteSpeed(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of AbsoluteSpeed
@@ -4033,6 +4144,8 @@ class RelativeSpeedToMaster(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element to RelativeSpeedToMaster
@@ -4128,6 +4241,8 @@ class TargetDistanceSteadyState(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of TargetDistanceSteadyState
@@ -4199,6 +4314,8 @@ class TargetTimeSteadyState(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of TargetTimeSteadyState
@@ -4395,11 +4512,15 @@ class ValueConstraintGroup(VersionBase):
         self.value_constraints = []
 
     def __eq__(self, other):
+        if other is self:
+            return True
         if isinstance(other, ValueConstraintGroup):
             if self.value_constraints == other.value_constraints:
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     def add_value_constraint(self, value_constraint):
         """adds a value constraint to the value constraint group
 
@@ -4408,6 +4529,7 @@ class ValueConstraintGroup(VersionBase):
             value_constraint (ValueConstraint): the value constraint to be added
 
         """
+        self._invalidate_caches()
         if not isinstance(value_constraint, ValueConstraint):
             raise TypeError("value_conatraint input is not of type ValueConstraint")
         self.value_constraints.append(value_constraint)
@@ -4433,6 +4555,7 @@ class ValueConstraintGroup(VersionBase):
             value_constraints.add_value_constraint(value_constraint)
         return value_constraints
 
+    @cached_element
     def get_element(self):
         """returns the elementTree of the ValueConstraintGroup"""
         if self.isVersion(minor=0):
@@ -4495,6 +4618,8 @@ class ValueConstraint(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of ValueConstraint
@@ -4519,6 +4644,7 @@ class ValueConstraint(VersionBase):
         retdict["value"] = str(self.value)
         return retdict
 
+    @cached_element
     def get_element(self):
         """returns the elementTree of the ValueConstraint"""
         if self.isVersion(minor=0):
@@ -4593,6 +4719,8 @@ class ColorRGB(_ColorDefinition):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of ColorRGB
@@ -4698,6 +4826,8 @@ class ColorCMYK(_ColorDefinition):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of ColorCMYK
@@ -4789,6 +4919,8 @@ class Color(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of Color
@@ -4861,6 +4993,8 @@ class UserDefinedLight(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parsese the xml element of a UserDefinedLight
@@ -4958,6 +5092,8 @@ class _LightState(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parsese the xml element of a _LightState
@@ -5060,6 +5196,8 @@ class AnimationFile(_AnimationType):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of a AnimationFile
@@ -5148,6 +5286,8 @@ class DirectionOfTravelDistribution(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of a DirectionOfTravelDistribution
@@ -5225,6 +5365,8 @@ class UserDefinedAnimation(_AnimationType):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of a UserDefinedAnimation
@@ -5298,6 +5440,8 @@ class UserDefinedComponent(_AnimationType):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of a UserDefinedComponent
@@ -5387,6 +5531,8 @@ class PedestrianAnimation(_AnimationType):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of a PedestrianAnimation
@@ -5418,6 +5564,7 @@ class PedestrianAnimation(_AnimationType):
             gesture (PedestrianGestureType): A new gesture of the pedestrian
 
         """
+        self._invalidate_caches()
         self.gestures.append(convert_enum(gesture, PedestrianGestureType))
         return self
 
@@ -5483,6 +5630,8 @@ class _VehicleComponent(VersionBase):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of a VehicleComponent
@@ -5564,6 +5713,8 @@ class _ComponentAnimation(_AnimationType):
                 return True
         return False
 
+    __hash__ = VersionBase.__hash__
+
     @staticmethod
     def parse(element):
         """Parses the xml element of a ComponentAnimation
@@ -17,6 +17,7 @@ setuptools.setup(
     packages=setuptools.find_packages(),
     keywords=["OpenDRIVE", "OpenSCENARIO", "xml"],
     install_requires=["numpy", "scipy", "pyclothoids", "xmlschema", "lxml"],
+    extras_require={"test": ["pytest", "pytest-xdist"]},
     classifiers=[
         "Programming Language :: Python :: 3",
         "Programming Language :: Python :: 3.6",
@@ -0,0 +1,82 @@
+"""
+  scenariogeneration
+  https://github.com/pyoscx/scenariogeneration
+
+  This Source Code Form is subject to the terms of the Mozilla Public
+  License, v. 2.0. If a copy of the MPL was not distributed with this
+  file, You can obtain one at https://mozilla.org/MPL/2.0/.
+
+  Copyright (c) 2022 The scenariogeneration Authors.
+
+"""
+import os
+from functools import lru_cache
+
+import pytest
+
+from scenariogeneration import prettyprint
+from scenariogeneration import xosc as OSC
+
+
+@pytest.fixture
+def pp():
+    """prettyprint gated behind the XOSC_PRETTY environment variable, so a
+    default test run skips the serialization and stdout work entirely
+    """
+    if os.environ.get("XOSC_PRETTY"):
+        return prettyprint
+    return lambda *args, **kwargs: None
+
+
+@pytest.fixture(scope="session")
+def sample_properties():
+    """a shared Properties builder, only for tests that never mutate it"""
+    prop = OSC.Properties()
+    prop.add_property("mything", "2")
+    prop.add_property("theotherthing", "true")
+    return prop
+
+
+@pytest.fixture
+def fresh_properties():
+    """factory for independent Properties builders, for tests that need to
+    mutate or compare their own instances
+    """
+
+    def _make():
+        prop = OSC.Properties()
+        prop.add_property("mything", "2")
+        prop.add_property("theotherthing", "true")
+        return prop
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def vc_factory():
+    """cached ValueConstraint factory; the same instance can be shared since
+    constraints are immutable once built
+    """
+
+    @lru_cache(maxsize=None)
+    def _make(rule, value):
+        return OSC.ValueConstraint(rule, value)
+
+    return _make
+
+
+@pytest.fixture(scope="session")
+def sample_phase_red_green():
+    """a shared red/green Phase, only for tests that never mutate it"""
+    phase = OSC.Phase("myphase", 1)
+    phase.add_signal_state("myid", "red")
+    phase.add_signal_state("myid", "green")
+    return phase
+
+
+@pytest.fixture(scope="session")
+def sample_controller(sample_properties):
+    """a shared Controller, only for tests that never mutate it"""
+    return OSC.Controller(
+        "mycontroler", sample_properties, controller_type=OSC.ControllerType.appearance
+    )
@@ -9,6 +9,9 @@
   Copyright (c) 2022 The scenariogeneration Authors.
 
 """
+import io
+import xml.etree.ElementTree as ET
+
 from scenariogeneration.xodr.geometry import Line, PlanView
 import pytest
 
@@ -425,3 +428,29 @@ def test_manual_geometry(data, expdata):
     assert pytest.approx(x, 0.000001) == data[1]
     assert pytest.approx(y, 0.000001) == data[2]
     assert pytest.approx(h, 0.000001) == data[3]
+
+
+def test_planview_write_fragment():
+    # adjusted planview (takes the array based serialization path)
+    planview = pyodrx.PlanView()
+    planview.add_geometry(Line(100))
+    planview.add_geometry(pyodrx.Arc(0.01, angle=np.pi / 2))
+    planview.add_geometry(pyodrx.Spiral(0.01, 0.001, 100))
+    planview.adjust_geometries()
+
+    buffer = io.StringIO()
+    planview.write_fragment(buffer)
+    fragment = ET.canonicalize(buffer.getvalue())
+    element = ET.canonicalize(ET.tostring(planview.get_element()))
+    assert fragment == element
+
+    # fixed geometries (takes the per-geometry fallback path)
+    planview2 = pyodrx.PlanView()
+    planview2.add_fixed_geometry(pyodrx.Line(100), 0, 0, 0)
+    planview2.add_fixed_geometry(pyodrx.ParamPoly3(0, 1, 2, 3, 0, 4, 5, 6), 100, 0, 0)
+
+    buffer2 = io.StringIO()
+    planview2.write_fragment(buffer2)
+    fragment2 = ET.canonicalize(buffer2.getvalue())
+    element2 = ET.canonicalize(ET.tostring(planview2.get_element()))
+    assert fragment2 == element2